@@ -1,51 +1,318 @@
 # %%
 
+import math
+import numbers
+
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.collections import PatchCollection
+from matplotlib.patches import Rectangle
 from tqdm import tqdm
-from collections import Counter
+from numba import njit
+
+# --- Packing kernels (free-rectangle splitting, compiled with Numba) ---
+# Free rectangle sizes are packed into one uint64 record: width in the high 32 bits,
+# height in the low 32 bits. Setting the top bit of each lane before subtracting a
+# query keeps borrows from crossing lanes, and a lane's guard bit survives exactly
+# when that dimension is large enough, so the fit test is a single compare per
+# rectangle instead of one per dimension.
+_LANE_MASK = np.uint64(0xFFFF_FFFF)
+_SWAR_GUARD = np.uint64(0x8000_0000_8000_0000)
+_LEFTOVER_MASK = np.uint64(0x7FFF_FFFF)
+
+
+@njit(cache=True)
+def _pack_wh(w, h):
+    """Pack a (w, h) pair into a uint64 record."""
+    return (np.uint64(w) << np.uint64(32)) | np.uint64(h)
+
+
+@njit(cache=True)
+def _find_free_rectangle(fwh, n_free, piece_width, piece_height):
+    """
+    Find the free rectangle and orientation that fit the piece with the shortest
+    leftover side (Best Short Side Fit), scoring both orientations. Ties prefer the
+    unrotated orientation, then the lowest index. Returns (index, rotated), with
+    index -1 if the piece fits nowhere.
+    """
+    queries = (_pack_wh(piece_width, piece_height), _pack_wh(piece_height, piece_width))
+    n_orientations = 1 if piece_width == piece_height else 2
+    best = -1
+    best_rotated = 0
+    best_short = _LANE_MASK
+    for i in range(n_free):
+        record = fwh[i] | _SWAR_GUARD
+        for rotated in range(n_orientations):
+            d = record - queries[rotated]
+            if d & _SWAR_GUARD == _SWAR_GUARD:
+                # Below their guard bits, the lanes of d hold the leftover sides.
+                short = min((d >> np.uint64(32)) & _LEFTOVER_MASK, d & _LEFTOVER_MASK)
+                if short < best_short or (
+                    short == best_short and rotated < best_rotated
+                ):
+                    best = i
+                    best_rotated = rotated
+                    best_short = short
+        if best_short == 0 and best_rotated == 0:
+            break  # Nothing can beat an unrotated exact fit on one side.
+    return best, best_rotated
+
+
+@njit(cache=True)
+def _place_run(fx, fy, fwh, n_free, piece_width, piece_height, max_count, placements):
+    """
+    Place a run of up to max_count identical pieces side by side in the free
+    rectangle and orientation chosen by _find_free_rectangle for one of them.
+    Writes a row of (x, y, w, h, rotated) into placements for each piece placed,
+    splits the used free rectangle and returns (new number of free rectangles,
+    pieces placed).
+    Free rectangles are stored as parallel arrays (fx, fy, fwh), which must have
+    room for one more rectangle than n_free.
+    """
+    i, rotated = _find_free_rectangle(fwh, n_free, piece_width, piece_height)
+    if i < 0:
+        return n_free, 0
+    if rotated:
+        w, h = piece_height, piece_width
+    else:
+        w, h = piece_width, piece_height
+    x, y = fx[i], fy[i]
+    free_w = np.int32(fwh[i] >> np.uint64(32))
+    free_h = np.int32(fwh[i] & _LANE_MASK)
+    # Place the pieces in a row from the top-left corner of the free rectangle.
+    count = min(max_count, free_w // w)
+    for k in range(count):
+        placements[k, 0] = x + k * w
+        placements[k, 1] = y
+        placements[k, 2] = w
+        placements[k, 3] = h
+        placements[k, 4] = rotated
+    run_w = count * w
+    # Remove the free rectangle that we used (swap with the last one).
+    n_free -= 1
+    fx[i], fy[i], fwh[i] = fx[n_free], fy[n_free], fwh[n_free]
+    # Split the remaining space:
+    # Free rectangle to the right.
+    if free_w - run_w > 0:
+        fx[n_free], fy[n_free], fwh[n_free] = x + run_w, y, _pack_wh(free_w - run_w, h)
+        n_free += 1
+    # Free rectangle below.
+    if free_h - h > 0:
+        fx[n_free], fy[n_free], fwh[n_free] = x, y + h, _pack_wh(free_w, free_h - h)
+        n_free += 1
+    return n_free, count
+
+
+@njit(cache=True)
+def _merge_pass(fx, fy, fwh, n_free, vertical):
+    """
+    Merge free rectangles that share a full edge, stacked vertically (same x and
+    width) or side by side (same y and height). Rectangles are sorted by position
+    so that mergeable ones become neighbours, and compacted in place in that order.
+    Returns the new number of free rectangles.
+    """
+    if vertical:
+        key = (fx[:n_free].astype(np.int64) << 32) | fy[:n_free]
+    else:
+        key = (fy[:n_free].astype(np.int64) << 32) | fx[:n_free]
+    order = np.argsort(key)
+    sx, sy, swh = fx[:n_free][order], fy[:n_free][order], fwh[:n_free][order]
+    m = 0
+    for k in range(n_free):
+        x, y = sx[k], sy[k]
+        w = np.int32(swh[k] >> np.uint64(32))
+        h = np.int32(swh[k] & _LANE_MASK)
+        if m > 0:
+            prev_w = np.int32(fwh[m - 1] >> np.uint64(32))
+            prev_h = np.int32(fwh[m - 1] & _LANE_MASK)
+            if vertical and fx[m - 1] == x and prev_w == w and fy[m - 1] + prev_h == y:
+                fwh[m - 1] = _pack_wh(w, prev_h + h)
+                continue
+            if (
+                not vertical
+                and fy[m - 1] == y
+                and prev_h == h
+                and fx[m - 1] + prev_w == x
+            ):
+                fwh[m - 1] = _pack_wh(prev_w + w, h)
+                continue
+        fx[m], fy[m], fwh[m] = x, y, swh[k]
+        m += 1
+    return m
+
+
+@njit(cache=True)
+def _coalesce(fx, fy, fwh, n_free):
+    """Merge adjacent free rectangles; returns the new number of free rectangles."""
+    n_free = _merge_pass(fx, fy, fwh, n_free, True)
+    return _merge_pass(fx, fy, fwh, n_free, False)
+
+
+@njit(cache=True)
+def _pack_types(fx, fy, fwh, placements, pieces_wh, remaining):
+    """
+    Pack piece types (an (T, 2) int32 array of sizes, in order) onto an empty board
+    whose only free rectangle is entry 0 of (fx, fy, fwh), with remaining[t] copies
+    still to be packed of type t. Copies of a type are placed in runs until none is
+    left or the next one no longer fits. The free rectangle arrays need room for
+    remaining.sum() + 1 entries and placements for remaining.sum() rows.
+
+    Returns (n_placed, packed_counts), where packed_counts is an int32 array with the
+    number of pieces packed of each type.
+    """
+    n_free = 1
+    n_coalesced = 1  # Free rectangle count after the last coalescing pass.
+    n_types = pieces_wh.shape[0]
+    packed_counts = np.zeros(n_types, dtype=np.int32)
+    n_placed = 0
+    for t in range(n_types):
+        pw, ph = pieces_wh[t, 0], pieces_wh[t, 1]
+        # Once a copy fails to fit, the rest of the type cannot fit either: free
+        # space only grows back by coalescing, which happens after placements.
+        while packed_counts[t] < remaining[t]:
+            n_free, count = _place_run(
+                fx,
+                fy,
+                fwh,
+                n_free,
+                pw,
+                ph,
+                remaining[t] - packed_counts[t],
+                placements[n_placed:],
+            )
+            if count == 0:
+                break
+            packed_counts[t] += count
+            n_placed += count
+            # Coalesce whenever the free list has doubled since the last pass.
+            if n_free >= 2 * n_coalesced:
+                n_free = _coalesce(fx, fy, fwh, n_free)
+                n_coalesced = max(n_free, 1)
+    return n_placed, packed_counts
 
 
 # --- Panel packing (free-rectangle splitting) class ---
 class Panel:
     def __init__(self, width, height):
+        # Free rectangles as parallel arrays of x, y and packed (w, h) records;
+        # the first n_free are valid.
+        self.fx = np.empty(16, dtype=np.int32)
+        self.fy = np.empty(16, dtype=np.int32)
+        self.fwh = np.empty(16, dtype=np.uint64)
+        self.placements = []  # List of placements: (x, y, w, h, rotated)
+        self.reset(width, height)
+
+    def reset(self, width, height):
+        """
+        Rewind the panel to an empty width x height board, keeping its buffers.
+        """
         self.width = width
         self.height = height
         # Initially, the entire board is free.
-        self.free_rectangles = [(0, 0, width, height)]
-        self.placements = []  # List of placements: (x, y, w, h, rotated)
+        self.fx[0], self.fy[0], self.fwh[0] = 0, 0, _pack_wh(width, height)
+        self.n_free = 1
+        self.n_coalesced = 1  # Free rectangle count after the last coalescing pass.
+        self.placements.clear()
+
+    def _reserve(self, n_rectangles):
+        """Grow the free rectangle buffers to hold at least n_rectangles entries."""
+        if n_rectangles > len(self.fx):
+            size = max(n_rectangles, 2 * len(self.fx))
+            self.fx, self.fy, self.fwh = (
+                np.concatenate((a, np.empty(size - len(a), dtype=a.dtype)))
+                for a in (self.fx, self.fy, self.fwh)
+            )
 
     def try_place(self, piece_width, piece_height):
         """
         Try to place a piece (piece_width x piece_height) into the panel.
-        It attempts both orientations (rotated or not).
+        Both orientations are scored, and the piece goes into the free rectangle and
+        orientation with the smallest leftover short side (Best Short Side Fit);
+        ties prefer the unrotated orientation.
         If successful, updates free rectangles and returns (x, y, placed_w, placed_h, rotated).
         Otherwise returns None.
         """
-        for rotated in [False, True]:
-            if rotated:
-                w, h = piece_height, piece_width
-            else:
-                w, h = piece_width, piece_height
-            for i, (fx, fy, fw, fh) in enumerate(self.free_rectangles):
-                if fw >= w and fh >= h:
-                    # Place piece at the top-left corner of the free rectangle.
-                    x, y = fx, fy
-                    self.placements.append((x, y, w, h, rotated))
-                    # Remove the free rectangle that we used.
-                    del self.free_rectangles[i]
-                    # Split the remaining space:
-                    # Free rectangle to the right.
-                    if fw - w > 0:
-                        self.free_rectangles.append((fx + w, fy, fw - w, h))
-                    # Free rectangle below.
-                    if fh - h > 0:
-                        self.free_rectangles.append((fx, fy + h, fw, fh - h))
-                    return (x, y, w, h, rotated)
-        return None
+        # A placement adds at most one free rectangle.
+        self._reserve(self.n_free + 1)
+        placement = np.empty((1, 5), dtype=np.int32)
+        self.n_free, count = _place_run(
+            self.fx,
+            self.fy,
+            self.fwh,
+            self.n_free,
+            piece_width,
+            piece_height,
+            1,
+            placement,
+        )
+        if count == 0:
+            return None
+        # Coalesce whenever the free list has doubled since the last pass.
+        if self.n_free >= 2 * self.n_coalesced:
+            self.n_free = _coalesce(self.fx, self.fy, self.fwh, self.n_free)
+            self.n_coalesced = max(self.n_free, 1)
+        x, y, w, h, rotated = (int(v) for v in placement[0])
+        self.placements.append((x, y, w, h, bool(rotated)))
+        return self.placements[-1]
+
+
+# --- Reusable packing buffers for the optimizer ---
+class _BoardPacker:
+    """
+    Packs piece types onto an empty width x height board in runs (see _pack_types),
+    reusing its buffers across calls. Unlike Panel it keeps no state between calls.
+    """
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.fx = np.empty(0, dtype=np.int32)
+        self.fy = np.empty(0, dtype=np.int32)
+        self.fwh = np.empty(0, dtype=np.uint64)
+        self.placements = np.empty((0, 5), dtype=np.int32)
+
+    def pack(self, pieces_wh, remaining):
+        """
+        Pack remaining[t] copies of each piece type t onto an empty board.
+        Returns (placements, packed_counts); placements is a view into the packer's
+        buffer, overwritten by the next call.
+        """
+        n_pieces = int(remaining.sum())
+        # Each run adds at most one free rectangle, so n_pieces + 1 always suffice.
+        if n_pieces + 1 > len(self.fx):
+            self.fx = np.empty(n_pieces + 1, dtype=np.int32)
+            self.fy = np.empty(n_pieces + 1, dtype=np.int32)
+            self.fwh = np.empty(n_pieces + 1, dtype=np.uint64)
+            self.placements = np.empty((n_pieces, 5), dtype=np.int32)
+        self.fx[0], self.fy[0] = 0, 0
+        self.fwh[0] = _pack_wh(self.width, self.height)
+        n_placed, packed_counts = _pack_types(
+            self.fx, self.fy, self.fwh, self.placements, pieces_wh, remaining
+        )
+        return self.placements[:n_placed], packed_counts
 
 
 # --- Optimizer for purchasing boards ---
+# The packing kernels work on int32 values and pack (w, h) pairs into 32-bit lanes.
+_MAX_DIMENSION = 2**31 - 1
+
+
+def _check_integer(value, name, minimum=0):
+    """
+    Raise ValueError unless value is a whole number (integral floats such as 1220.0
+    are accepted) in [minimum, _MAX_DIMENSION].
+    """
+    if (
+        isinstance(value, bool)
+        or not isinstance(value, numbers.Real)
+        or not float(value).is_integer()
+        or not minimum <= value <= _MAX_DIMENSION
+    ):
+        raise ValueError(
+            f"{name} must be an integer from {minimum} to 2**31 - 1, got {value!r}"
+        )
+
+
 def optimize_purchase(required_pieces, available_boards):
     """
     Given a list of required pieces and available board types, find a combination of boards
@@ -60,47 +327,117 @@ def optimize_purchase(required_pieces, available_boards):
       cutting_plan: list of placements (x, y, w, h, board_number, rotated)
       board_solution: list of board types used (each as (width, height, cost))
       total_cost: total cost of purchased boards
+      board_solution_idx: list of indices into available_boards of the board types used
+         (identical entries in available_boards all map to the first of them)
+
+    Raises ValueError if a piece dimension is not an integer from 1 to 2**31 - 1, or a
+    board dimension or a quantity is not an integer from 0 to 2**31 - 1, or the
+    quantities of pieces of the same size add up to more than 2**31 - 1.
     """
-    # Expand required pieces into individual items.
-    pieces = []
     for w, h, qty in required_pieces:
-        for _ in range(qty):
-            pieces.append((w, h))
-    # Sort pieces descending by area (heuristic)
-    pieces.sort(key=lambda p: p[0] * p[1], reverse=True)
+        _check_integer(w, "Piece width", minimum=1)
+        _check_integer(h, "Piece height", minimum=1)
+        _check_integer(qty, "Piece quantity")
+    for bw, bh, _ in available_boards:
+        _check_integer(bw, "Board width")
+        _check_integer(bh, "Board height")
+
+    # Group required pieces into piece types by size, in order of first appearance.
+    required = np.array(required_pieces, dtype=np.int32).reshape(-1, 3)
+    sizes, first_index, type_of = np.unique(
+        required[:, :2], axis=0, return_index=True, return_inverse=True
+    )
+    quantities = np.zeros(len(sizes), dtype=np.int64)
+    np.add.at(quantities, type_of.ravel(), required[:, 2])
+    for (w, h), qty in zip(sizes.tolist(), quantities.tolist()):
+        if qty > _MAX_DIMENSION:
+            raise ValueError(
+                f"Total quantity of {w}x{h} pieces must be at most 2**31 - 1, got {qty}"
+            )
+    order = np.argsort(first_index)
+    pieces_wh = sizes[order].astype(np.int32)
+    remaining = quantities[order].astype(np.int32)  # Copies still to be packed.
+    areas = pieces_wh[:, 0].astype(np.int64) * pieces_wh[:, 1]
+    # Sort piece types descending by area (heuristic); stable, so ties keep input order.
+    order = np.argsort(-areas, kind="stable")
+    pieces_wh = pieces_wh[order]
+    remaining = remaining[order]
+    areas = areas[order]
 
     total_cost = 0
     board_solution = []  # List of board types used.
+    board_solution_idx = []  # Indices of those board types in available_boards.
+    # Index of the first entry identical to each board type, so that repeated
+    # entries in available_boards count as one board type.
+    first_identical = {}
+    canonical_idx = [
+        first_identical.setdefault(tuple(board), i)
+        for i, board in enumerate(available_boards)
+    ]
     cutting_plan = []  # Global cutting plan across boards.
     board_count = 0  # Number of boards used.
 
-    pbar = tqdm(total=len(pieces), desc="Packing pieces")
-    while pieces:
+    # A board never packs more than its own area, so cost / board area is a lower bound
+    # on its efficiency. Board types are tried from the lowest bound up; zero-area
+    # boards pack nothing and get an infinite bound, so they are never needed.
+    board_bound = [
+        cost / (bw * bh) if bw * bh > 0 else math.inf
+        for bw, bh, cost in available_boards
+    ]
+    board_order = sorted(range(len(available_boards)), key=board_bound.__getitem__)
+
+    # The packing only depends on the board size, so board types of the same size
+    # share one reusable packer and one simulation. A packer's placement buffer backs
+    # only its own cache entry below, which is dropped before it is packed again.
+    packers = {}
+    for bw, bh, _ in available_boards:
+        if (bw, bh) not in packers:
+            packers[(bw, bh)] = _BoardPacker(int(bw), int(bh))
+
+    # Cached _BoardPacker.pack results per board size: (placements, packed_counts,
+    # packed_area). Piece types that fail to fit leave the free rectangles untouched,
+    # so a simulation stays valid as long as no other board consumes pieces of the
+    # types it packed.
+    simulations = {}
+
+    pbar = tqdm(total=int(remaining.sum()), desc="Packing pieces", mininterval=0.5)
+    while remaining.any():
         best_efficiency = None  # (cost per unit area packed)
         best_board = None  # Chosen board type (width, height, cost)
-        best_panel = None  # Simulation panel instance.
-        best_packed_indices = None  # Indices of pieces that got packed.
+        best_board_idx = None  # Index of the chosen board type in available_boards.
+        best_placements = None  # Simulated placements: rows of (x, y, w, h, rotated).
+        best_packed_counts = None  # Number of pieces of each type that got packed.
 
-        # Try each available board type.
-        for board in available_boards:
+        # Try each available board type that could still beat the best one.
+        for board_idx in board_order:
+            if best_efficiency is not None and board_bound[board_idx] > best_efficiency:
+                break
+            board = available_boards[board_idx]
             board_width, board_height, cost = board
-            panel = Panel(board_width, board_height)
-            packed_indices = []
-            # Simulate packing the pieces (already sorted).
-            for i, (pw, ph) in enumerate(pieces):
-                pos = panel.try_place(pw, ph)
-                if pos is not None:
-                    packed_indices.append(i)
-            if not packed_indices:
+            size = (board_width, board_height)
+            if size not in simulations:
+                # Simulate packing the pieces (already sorted).
+                placements, packed_counts = packers[size].pack(pieces_wh, remaining)
+                simulations[size] = (
+                    placements,
+                    packed_counts,
+                    (areas * packed_counts).sum(),
+                )
+            placements, packed_counts, packed_area = simulations[size]
+            if packed_area == 0:
                 continue  # This board type couldn’t pack any remaining piece.
-            # Compute total packed area.
-            packed_area = sum(pieces[i][0] * pieces[i][1] for i in packed_indices)
             efficiency = cost / packed_area  # Lower is better.
-            if best_efficiency is None or efficiency < best_efficiency:
+            # On ties, prefer the board type listed first in available_boards.
+            if (
+                best_efficiency is None
+                or efficiency < best_efficiency
+                or (efficiency == best_efficiency and board_idx < best_board_idx)
+            ):
                 best_efficiency = efficiency
                 best_board = board
-                best_panel = panel
-                best_packed_indices = packed_indices
+                best_board_idx = board_idx
+                best_placements = placements
+                best_packed_counts = packed_counts
 
         if best_board is None:
             raise ValueError(
@@ -112,18 +449,24 @@ def optimize_purchase(required_pieces, available_boards):
         board_width, board_height, cost = best_board
         total_cost += cost
         board_solution.append(best_board)
+        board_solution_idx.append(canonical_idx[best_board_idx])
+
+        # Record placements from the best simulation.
+        for x, y, w, h, rotated in best_placements.tolist():
+            cutting_plan.append((x, y, w, h, board_count, bool(rotated)))
 
-        # Record placements from the best panel.
-        for placement in best_panel.placements:
-            x, y, w, h, rotated = placement
-            cutting_plan.append((x, y, w, h, board_count, rotated))
+        # Consume the pieces that were packed in this board.
+        remaining -= best_packed_counts
+        pbar.update(len(best_placements))
 
-        # Remove the pieces that were packed in this board (remove in reverse order).
-        for i in sorted(best_packed_indices, reverse=True):
-            del pieces[i]
-            pbar.update(1)
+        # Invalidate cached simulations that packed any type with consumed pieces
+        # (including the winner's own).
+        consumed = best_packed_counts > 0
+        for size, (_, packed_counts, _) in list(simulations.items()):
+            if (packed_counts[consumed] > 0).any():
+                del simulations[size]
     pbar.close()
-    return cutting_plan, board_solution, total_cost
+    return cutting_plan, board_solution, total_cost, board_solution_idx
 
 
 # --- Visualization function ---
@@ -141,6 +484,10 @@ def visualize_boards(board_solution, cutting_plan):
     for placement in cutting_plan:
         x, y, w, h, board_num, rotated = placement
         boards[board_num].append(placement)
+    # One random color per piece, drawn up front from a seeded generator so plots
+    # are reproducible.
+    colors = np.random.default_rng(0).random((len(cutting_plan), 3))
+    n_drawn = 0
     for board_num in range(1, total_boards + 1):
         board_width, board_height, cost = board_solution[board_num - 1]
         ax = axes[board_num - 1]
@@ -150,17 +497,18 @@ def visualize_boards(board_solution, cutting_plan):
         ax.set_xticks(np.arange(0, board_width + 1, 100))
         ax.set_yticks(np.arange(0, board_height + 1, 100))
         ax.grid(True, linestyle="--", linewidth=0.5)
-        for x, y, w, h, b, rotated in boards[board_num]:
-            rect = plt.Rectangle(
-                (x, y),
-                w,
-                h,
-                edgecolor="black",
-                facecolor=np.random.rand(
-                    3,
-                ),
+        placements = boards[board_num]
+        # Draw all pieces of the board as a single collection.
+        rects = [Rectangle((x, y), w, h) for x, y, w, h, b, rotated in placements]
+        ax.add_collection(
+            PatchCollection(
+                rects,
+                facecolors=colors[n_drawn : n_drawn + len(placements)],
+                edgecolors="black",
             )
-            ax.add_patch(rect)
+        )
+        n_drawn += len(placements)
+        for x, y, w, h, b, rotated in placements:
             label = f"{w}x{h}" + (" (R)" if rotated else "")
             ax.text(
                 x + w / 2,
@@ -176,15 +524,18 @@ def visualize_boards(board_solution, cutting_plan):
 
 
 # --- Function to print the shopping list of boards ---
-def print_shopping_list(board_solution):
+def print_shopping_list(board_solution_idx, available_boards):
     """
-    Aggregates board_solution (a list of board types used, each as (width, height, cost))
-    and prints the shopping list.
+    Aggregates board_solution_idx (indices into available_boards of the board types used,
+    as returned by optimize_purchase) and prints the shopping list in purchase order.
     """
-    counts = Counter(board_solution)
+    counts = np.bincount(board_solution_idx, minlength=len(available_boards))
+    # Board types in the order they were first purchased.
+    used, first_purchase = np.unique(board_solution_idx, return_index=True)
     print("Shopping List:")
-    for board, quantity in counts.items():
-        width, height, cost = board
+    for board_idx in used[np.argsort(first_purchase)]:
+        width, height, cost = available_boards[board_idx]
+        quantity = counts[board_idx]
         print(f"{quantity} board(s) of size {width}x{height} (Cost: {cost} each)")
 
 
@@ -201,11 +552,11 @@ if __name__ == "__main__":
         (2500, 1250, 19),
     ]
 
-    cutting_plan, board_solution, total_cost = optimize_purchase(
+    cutting_plan, board_solution, total_cost, board_solution_idx = optimize_purchase(
         required_pieces, available_boards
     )
     print(f"Total cost: {total_cost}")
-    print_shopping_list(board_solution)
+    print_shopping_list(board_solution_idx, available_boards)
     visualize_boards(board_solution, cutting_plan)
 
 # https://www.leroymerlin.pt/produtos/madeiras-e-acrilicos/paineis-para-construcao/osb/?p=1&filters=%7B%22attribute-00596%22%3A%2215%22%2C%22vendor-1P%22%3A%22true%22%7D